@@ -1,25 +1,30 @@
 import argparse
 import sys
-from datetime import date, datetime
+from datetime import date
 from typing import Dict
 
 from . import __version__
 from .config import get_countdown_timer, get_deadline_timer, get_dob, load_config
-from . import timecalc
 
 
 MODES = ["day", "year", "life"]
 
+_SNAPSHOT_TEMPLATE = (
+    "now: {now:%Y-%m-%d %H:%M:%S}\n"
+    "DAY  done: {day_pct:5.1f}%  remaining: {day_remaining}\n"
+    "YEAR done: {year_pct:5.1f}%  remaining: {year_remaining}\n"
+    "LIFE done: {life_pct:5.1f}%  remaining: {life_remaining}"
+)
+
 
 def _headless_snapshot(config: Dict) -> str:
-    now = datetime.now().astimezone()
+    from . import timecalc
+
+    now = timecalc.now_local()
     dob = date.today()
     dob_str = get_dob(config)
     if dob_str:
-        try:
-            dob = datetime.strptime(dob_str, "%Y-%m-%d").date()
-        except ValueError:
-            dob = date.today()
+        dob = _parse_dob(dob_str) or dob
 
     day = timecalc.day_info(now)
     year = timecalc.year_info(now)
@@ -28,10 +33,15 @@ def _headless_snapshot(config: Dict) -> str:
     deadline_cfg = get_deadline_timer(config)
 
     lines = [
-        f"now: {now.strftime('%Y-%m-%d %H:%M:%S')}",
-        f"DAY  done: {day.progress * 100:5.1f}%  remaining: {day.remaining_str}",
-        f"YEAR done: {year.progress * 100:5.1f}%  remaining: {year.remaining_str}",
-        f"LIFE done: {life.progress * 100:5.1f}%  remaining: {life.remaining_str}",
+        _SNAPSHOT_TEMPLATE.format(
+            now=now,
+            day_pct=day.progress * 100,
+            day_remaining=day.remaining_str,
+            year_pct=year.progress * 100,
+            year_remaining=year.remaining_str,
+            life_pct=life.progress * 100,
+            life_remaining=life.remaining_str,
+        )
     ]
     if countdown_cfg and countdown_cfg["duration_seconds"] > 0:
         duration = countdown_cfg["duration_seconds"]
@@ -41,8 +51,8 @@ def _headless_snapshot(config: Dict) -> str:
         progress = 1.0 if done else (duration - remaining) / max(1, duration)
         lines.append(f"COUNTDOWN done: {progress * 100:5.1f}%  remaining: {remaining_str}")
     if deadline_cfg:
-        target_time = _parse_iso_local(deadline_cfg["target_local_datetime_iso"])
-        set_time = _parse_iso_local(deadline_cfg["set_local_datetime_iso"])
+        target_time = timecalc.parse_iso_local(deadline_cfg["target_local_datetime_iso"])
+        set_time = timecalc.parse_iso_local(deadline_cfg["set_local_datetime_iso"])
         if target_time and set_time:
             deadline = timecalc.deadline_info(set_time, target_time, now)
             done = deadline.progress >= 1.0
@@ -51,17 +61,22 @@ def _headless_snapshot(config: Dict) -> str:
     return "\n".join(lines)
 
 
-def _parse_iso_local(text: str) -> datetime | None:
+def _parse_dob(text: str) -> date | None:
+    if text[4] != "-" or text[7] != "-" or not (text[0:4] + text[5:7] + text[8:10]).isdigit():
+        return None
     try:
-        parsed = datetime.fromisoformat(text)
+        return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
     except ValueError:
         return None
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=datetime.now().astimezone().tzinfo)
-    return parsed
 
 
 def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if "--version" in argv:
+        print(f"hourglass {__version__}")
+        raise SystemExit(0)
+
     epilog = (
         "Controls (interactive): q quit, space pause/resume, h help/settings. "
         "Dashboard shows DAY, YEAR, LIFE columns simultaneously."
@@ -1,10 +1,21 @@
+import atexit
+import functools
 import json
 import os
 import platform
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+SAVE_INTERVAL = 5.0
 
+_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_pending: Optional[Dict[str, Any]] = None
+_last_written: Optional[Tuple[str, Tuple[int, int]]] = None
+_last_write = float("-inf")
+
+
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     system = platform.system().lower()
     if system == "darwin":
@@ -20,25 +31,66 @@ def get_config_path() -> Path:
     return base / "hourglass" / "config.json"
 
 
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_config() -> Dict[str, Any]:
+    flush_config()
     path = get_config_path()
+    key = _stat_key(path)
+    if key is None:
+        return {}
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return dict(cached[1])
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                return data
+        with path.open("rb") as f:
+            data = json.loads(f.read())
     except FileNotFoundError:
         return {}
-    except json.JSONDecodeError:
+    except ValueError:
         return {}
-    return {}
+    if not isinstance(data, dict):
+        return {}
+    _CACHE[path] = (key, data)
+    return dict(data)
 
 
 def save_config(data: Dict[str, Any]) -> None:
+    global _pending
+    _pending = data
+    flush_config_if_due()
+
+
+def flush_config_if_due() -> None:
+    if _pending is not None and time.monotonic() - _last_write >= SAVE_INTERVAL:
+        flush_config()
+
+
+def flush_config() -> None:
+    global _pending, _last_write, _last_written
+    if _pending is None:
+        return
+    data, _pending = _pending, None
+    _last_write = time.monotonic()
     path = get_config_path()
+    text = json.dumps(data, indent=2, sort_keys=True)
+    if _last_written is not None and _last_written[0] == text and _last_written[1] == _stat_key(path):
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    _last_written = (text, _stat_key(path))
+
+
+atexit.register(flush_config)
 
 
 def get_dob(config: Dict[str, Any]) -> Optional[str]:
@@ -1,16 +1,16 @@
 import random
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Grain:
     x: float
     y: float
     vx: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Sparkle:
     x: int
     y: int
@@ -23,15 +23,21 @@ class SandColumn:
         self.sparkles: List[Sparkle] = []
         self.spawn_accum = 0.0
         self.fall_speed = 6.0
+        self.version = 0
+        self._cells: Tuple[Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]] = ((), ())
+        self._render_key: Tuple = ()
+        self._render_offsets: Tuple[Tuple[int, int], ...] = ()
 
     def reset(self) -> None:
+        if not self.grains and not self.sparkles and self.spawn_accum == 0.0:
+            return
         self.grains.clear()
         self.sparkles.clear()
         self.spawn_accum = 0.0
+        self._cells = ((), ())
+        self.version += 1
 
-    def update(self, dt: float, inner_left: int, inner_right: int, inner_top: int, surface_row: int, paused: bool) -> None:
-        if paused:
-            return
+    def update(self, dt: float, inner_left: int, inner_right: int, inner_top: int, surface_row: int) -> None:
         if inner_left > inner_right:
             return
 
@@ -42,37 +48,62 @@ class SandColumn:
             start_x = max(inner_left, min(inner_right, start_x))
             self.grains.append(Grain(x=start_x, y=inner_top, vx=random.uniform(-0.4, 0.4)))
 
-        for grain in list(self.grains):
-            grain.vx += random.uniform(-0.6, 0.6) * dt
-            grain.vx = max(-0.6, min(0.6, grain.vx))
-            next_x = grain.x + grain.vx
-            if next_x < inner_left and grain.vx < 0:
-                grain.vx = -grain.vx
+        jitter_span = 1.2 * dt
+        fall = self.fall_speed * dt
+        landing_row = surface_row - 1
+        sparkle_y = max(inner_top, landing_row)
+        _random = random.random
+        _min = min
+        _max = max
+        _round = round
+        grains: List[Grain] = []
+        for grain in self.grains:
+            vx = _max(-0.6, _min(0.6, grain.vx + (_random() - 0.5) * jitter_span))
+            next_x = grain.x + vx
+            if next_x < inner_left and vx < 0:
+                vx = -vx
                 next_x = inner_left + 1
-            elif next_x > inner_right and grain.vx > 0:
-                grain.vx = -grain.vx
+            elif next_x > inner_right and vx > 0:
+                vx = -vx
                 next_x = inner_right - 1
 
-            grain.x = max(inner_left, min(inner_right, next_x))
-            grain.y += self.fall_speed * dt
+            grain.vx = vx
+            grain.x = _max(inner_left, _min(inner_right, next_x))
+            grain.y += fall
 
-            if grain.y >= surface_row - 1:
-                self.grains.remove(grain)
-                sparkle_ttl = random.uniform(0.5, 1.5)
-                sparkle_y = max(inner_top, surface_row - 1)
-                self.sparkles.append(Sparkle(x=int(round(grain.x)), y=sparkle_y, ttl=sparkle_ttl))
+            if grain.y >= landing_row:
+                sparkle_ttl = 0.5 + _random()
+                self.sparkles.append(Sparkle(x=round(grain.x), y=sparkle_y, ttl=sparkle_ttl))
+            else:
+                grains.append(grain)
+        self.grains = grains
 
-        for sparkle in list(self.sparkles):
+        sparkles: List[Sparkle] = []
+        for sparkle in self.sparkles:
             sparkle.ttl -= dt
-            if sparkle.ttl <= 0:
-                self.sparkles.remove(sparkle)
+            if sparkle.ttl > 0:
+                sparkles.append(sparkle)
+        self.sparkles = sparkles
 
-    def render(self, canvas, grain_ch: str = ".", sparkle_ch: str = "*") -> None:
-        for grain in self.grains:
-            x = int(round(grain.x))
-            y = int(round(grain.y))
-            if 0 <= y < len(canvas) and 0 <= x < len(canvas[0]):
-                canvas[y][x] = grain_ch
-        for sparkle in self.sparkles:
-            if 0 <= sparkle.y < len(canvas) and 0 <= sparkle.x < len(canvas[0]):
-                canvas[sparkle.y][sparkle.x] = sparkle_ch
+        cells = (
+            tuple((_round(grain.x), _round(grain.y)) for grain in grains),
+            tuple((sparkle.x, sparkle.y) for sparkle in sparkles),
+        )
+        if cells != self._cells:
+            self._cells = cells
+            self.version += 1
+
+    def render(self, canvas: bytearray, cols: int, grain_ch: str = ".", sparkle_ch: str = "*") -> None:
+        height = len(canvas) // cols
+        key = (self.version, cols, height, grain_ch, sparkle_ch)
+        if key != self._render_key:
+            grain_cells, sparkle_cells = self._cells
+            self._render_key = key
+            self._render_offsets = tuple(
+                (y * cols + x, code)
+                for cells, code in ((grain_cells, ord(grain_ch)), (sparkle_cells, ord(sparkle_ch)))
+                for x, y in cells
+                if 0 <= y < height and 0 <= x < cols
+            )
+        for offset, code in self._render_offsets:
+            canvas[offset] = code
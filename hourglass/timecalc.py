@@ -1,9 +1,18 @@
 import calendar
+import functools
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
+from datetime import date, datetime, time, timedelta, tzinfo
+from time import time as _epoch_seconds
 from typing import Optional, Tuple
 
 
+_BoundsCache = Tuple[Optional[Tuple[object, tzinfo]], Optional[datetime], Optional[datetime], float]
+
+_DAY_BOUNDS: _BoundsCache = (None, None, None, 0.0)
+_YEAR_BOUNDS: _BoundsCache = (None, None, None, 0.0)
+_LIFE_BOUNDS: _BoundsCache = (None, None, None, 0.0)
+
+
 @dataclass
 class TimeInfo:
     start: datetime
@@ -13,44 +22,90 @@ class TimeInfo:
     remaining_str: str
 
 
-def _local_tzinfo() -> datetime:
+def local_tzinfo() -> tzinfo:
+    return _local_tzinfo_for_hour(int(_epoch_seconds() // 3600))
+
+
+@functools.lru_cache(maxsize=1)
+def _local_tzinfo_for_hour(_hour: int) -> tzinfo:
     return datetime.now().astimezone().tzinfo
 
 
+def now_local() -> datetime:
+    return datetime.now(local_tzinfo())
+
+
 def _midnight_local(d: date) -> datetime:
-    tz = _local_tzinfo()
+    return _midnight(d, local_tzinfo())
+
+
+@functools.lru_cache(maxsize=8)
+def _midnight(d: date, tz: tzinfo) -> datetime:
     return datetime.combine(d, time(0, 0, 0), tzinfo=tz)
 
 
-def _format_hms(delta: timedelta) -> str:
-    total = max(0, int(delta.total_seconds()))
-    hours = total // 3600
-    minutes = (total % 3600) // 60
-    seconds = total % 60
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+def parse_iso_local(text: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=local_tzinfo())
+    return parsed
+
 
+def _whole_seconds(delta: timedelta) -> int:
+    return max(0, delta.days * 86400 + delta.seconds)
 
-def _format_dhms(delta: timedelta) -> str:
-    total = max(0, int(delta.total_seconds()))
-    days = total // 86400
-    hours = (total % 86400) // 3600
-    minutes = (total % 3600) // 60
-    seconds = total % 60
+
+def _format_dhms_seconds(total: int) -> str:
+    days, rem = divmod(total, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, seconds = divmod(rem, 60)
     return f"{days}d {hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
 def format_hms_seconds(seconds: int) -> str:
-    total = max(0, int(seconds))
-    hours = total // 3600
-    minutes = (total % 3600) // 60
-    secs = total % 60
+    hours, rem = divmod(max(0, int(seconds)), 3600)
+    minutes, secs = divmod(rem, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
 def format_remaining(delta: timedelta) -> str:
-    if delta.total_seconds() >= 86400:
-        return _format_dhms(delta)
-    return _format_hms(delta)
+    total = _whole_seconds(delta)
+    if total >= 86400:
+        return _format_dhms_seconds(total)
+    return format_hms_seconds(total)
+
+
+def _day_bounds(today: date) -> Tuple[datetime, datetime, float]:
+    global _DAY_BOUNDS
+    key = (today, local_tzinfo())
+    if _DAY_BOUNDS[0] != key:
+        start = _midnight(today, key[1])
+        end = _midnight(today + timedelta(days=1), key[1])
+        _DAY_BOUNDS = (key, start, end, (end - start).total_seconds())
+    return _DAY_BOUNDS[1], _DAY_BOUNDS[2], _DAY_BOUNDS[3]
+
+
+def _year_bounds(year: int) -> Tuple[datetime, datetime, float]:
+    global _YEAR_BOUNDS
+    key = (year, local_tzinfo())
+    if _YEAR_BOUNDS[0] != key:
+        start = _midnight(date(year, 1, 1), key[1])
+        end = _midnight(date(year + 1, 1, 1), key[1])
+        _YEAR_BOUNDS = (key, start, end, (end - start).total_seconds())
+    return _YEAR_BOUNDS[1], _YEAR_BOUNDS[2], _YEAR_BOUNDS[3]
+
+
+def _life_bounds(dob: date, lifespan_years: int) -> Tuple[datetime, datetime, float]:
+    global _LIFE_BOUNDS
+    key = ((dob, lifespan_years), local_tzinfo())
+    if _LIFE_BOUNDS[0] != key:
+        start = _midnight_local(dob)
+        end = add_years(start, lifespan_years)
+        _LIFE_BOUNDS = (key, start, end, (end - start).total_seconds())
+    return _LIFE_BOUNDS[1], _LIFE_BOUNDS[2], _LIFE_BOUNDS[3]
 
 
 def _clamp_day(year: int, month: int, day: int) -> int:
@@ -115,37 +170,41 @@ def _progress(now: datetime, start: datetime, end: datetime) -> float:
     return (now - start).total_seconds() / total
 
 
+def _progress_of(now: datetime, start: datetime, total: float) -> float:
+    elapsed = (now - start).total_seconds()
+    if elapsed <= 0:
+        return 0.0
+    if elapsed >= total:
+        return 1.0
+    return elapsed / total
+
+
 def day_info(now: Optional[datetime] = None) -> TimeInfo:
     if now is None:
-        now = datetime.now().astimezone()
-    today = now.date()
-    start = _midnight_local(today)
-    end = _midnight_local(today + timedelta(days=1))
-    remaining = end - now
-    return TimeInfo(start=start, end=end, now=now, progress=_progress(now, start, end), remaining_str=_format_hms(remaining))
+        now = now_local()
+    start, end, total = _day_bounds(now.date())
+    remaining = _whole_seconds(end - now)
+    return TimeInfo(start=start, end=end, now=now, progress=_progress_of(now, start, total), remaining_str=format_hms_seconds(remaining))
 
 
 def year_info(now: Optional[datetime] = None) -> TimeInfo:
     if now is None:
-        now = datetime.now().astimezone()
-    start = _midnight_local(date(now.year, 1, 1))
-    end = _midnight_local(date(now.year + 1, 1, 1))
-    remaining = end - now
-    return TimeInfo(start=start, end=end, now=now, progress=_progress(now, start, end), remaining_str=_format_dhms(remaining))
+        now = now_local()
+    start, end, total = _year_bounds(now.year)
+    remaining = _whole_seconds(end - now)
+    return TimeInfo(start=start, end=end, now=now, progress=_progress_of(now, start, total), remaining_str=_format_dhms_seconds(remaining))
 
 
 def life_info(dob: date, now: Optional[datetime] = None, lifespan_years: int = 85) -> TimeInfo:
     if now is None:
-        now = datetime.now().astimezone()
-    start = _midnight_local(dob)
-    end = add_years(start, lifespan_years)
-    remaining = end - now
-    return TimeInfo(start=start, end=end, now=now, progress=_progress(now, start, end), remaining_str=_format_ymdhms(now, end))
+        now = now_local()
+    start, end, total = _life_bounds(dob, lifespan_years)
+    return TimeInfo(start=start, end=end, now=now, progress=_progress_of(now, start, total), remaining_str=_format_ymdhms(now, end))
 
 
 def deadline_info(set_time: datetime, target_time: datetime, now: Optional[datetime] = None) -> TimeInfo:
     if now is None:
-        now = datetime.now().astimezone()
+        now = now_local()
     remaining = target_time - now
     return TimeInfo(
         start=set_time,
@@ -1,8 +1,8 @@
-import curses
+import functools
 import os
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -10,6 +10,8 @@ from . import timecalc
 from .config import (
     clear_countdown_timer,
     clear_deadline_timer,
+    flush_config,
+    flush_config_if_due,
     get_config_path,
     get_countdown_timer,
     get_deadline_timer,
@@ -27,6 +29,22 @@ LABEL_LINES = 3
 HEADER_LINES = 1
 MIN_COLUMN_HEIGHT = 8
 BOTTOM_PADDING = 1
+KEYDEBUG_MAX_BYTES = 64 * 1024
+FRAME_DELAY = 1.0 / 24.0
+IDLE_FRAME_DELAY = 1.0
+COUNTDOWN_SAVE_STEP = 10
+
+_ASCII_DIGITS = frozenset("0123456789")
+_DIGIT_PAIRS = {f"{i:02d}": i for i in range(100)}
+_KEYDEBUG_FH = None
+# Fill glyphs by depth below the sand surface, then the glyph for every deeper row.
+_FILL_GLYPHS = (b"..+++", b"#")
+_FLASH_FILL_GLYPHS = (b"", b"*")
+# Border edge run, side run and corner byte.
+_BORDER_GLYPHS = (b"-", b"|", ord("+"))
+_FLASH_BORDER_GLYPHS = (b"=", b"!", ord("*"))
+_PAUSE_KEY = ord(" ")
+_HELP_KEYS = (ord("h"), ord("H"))
 
 
 @dataclass
@@ -36,6 +54,20 @@ class ColumnState:
     sand: SandColumn
     progress: float = 0.0
     remaining: str = ""
+    flash: bool = False
+    fill_top: int = 0
+    label_progress: Optional[float] = field(default=None, init=False)
+    label_remaining: Optional[str] = field(default=None, init=False)
+    label_lines: List[bytes] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.label_lines = [self.label.encode("ascii"), b"", b""]
+
+
+@dataclass(frozen=True)
+class Layout:
+    positions: Tuple[Tuple[int, int], ...]
+    inner_widths: Tuple[int, ...]
 
 
 @dataclass
@@ -45,6 +77,7 @@ class CountdownState:
     is_running: bool = False
     configured: bool = False
     done_flash: bool = False
+    saved_remaining: int = 0
 
 
 @dataclass
@@ -67,8 +100,10 @@ class UIState:
         self.input_error = ""
         self.input_prev_view = "menu"
         self.last_keydebug = ""
-        self.last_time_update = 0.0
+        self.time_info_second = -1
         self.time_info: Optional[Dict[str, timecalc.TimeInfo]] = None
+        self.header_info: Optional[Dict[str, timecalc.TimeInfo]] = None
+        self.header = b""
         self.last_countdown_tick = 0.0
         self.last_flash_toggle = 0.0
         self.flash_on = False
@@ -81,6 +116,14 @@ class UIState:
         ]
         self.countdown_column = ColumnState("COUNTDOWN", "countdown", SandColumn())
         self.deadline_column = ColumnState("DEADLINE", "deadline", SandColumn())
+        self.visible_key: Optional[Tuple[bool, bool]] = None
+        self.visible_columns: List[ColumnState] = []
+        self.canvas = bytearray()
+        self.blank_canvas = b""
+        self.last_rendered: List[bytearray] = []
+        self.last_size: Tuple[int, int] = (0, 0)
+        self.force_full_redraw = True
+        self.last_frame_sig: Optional[tuple] = None
 
 
 def _prompt_dob(config: Dict) -> date:
@@ -104,24 +147,13 @@ def _ensure_dob(config: Dict) -> date:
     return _prompt_dob(config)
 
 
-def _local_tzinfo():
-    return datetime.now().astimezone().tzinfo
-
-
-def _parse_iso_local(text: str) -> Optional[datetime]:
-    try:
-        parsed = datetime.fromisoformat(text)
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=_local_tzinfo())
-    return parsed
-
-
 def _digits_only(text: str) -> str:
-    return "".join(ch for ch in text if ch.isdigit())
+    if text.isascii() and text.isdigit():
+        return text
+    return "".join(filter(_ASCII_DIGITS.__contains__, text))
 
 
+@functools.lru_cache(maxsize=256)
 def _format_countdown_digits(digits: str) -> str:
     slots = ["_"] * 6
     for idx, ch in enumerate(digits[:6]):
@@ -129,6 +161,7 @@ def _format_countdown_digits(digits: str) -> str:
     return f"{slots[0]}{slots[1]}:{slots[2]}{slots[3]}:{slots[4]}{slots[5]}"
 
 
+@functools.lru_cache(maxsize=256)
 def _format_deadline_digits(digits: str) -> str:
     slots = ["_"] * 12
     for idx, ch in enumerate(digits[:12]):
@@ -145,9 +178,12 @@ def _format_deadline_digits(digits: str) -> str:
 def _parse_countdown_digits(digits: str) -> Optional[int]:
     if len(digits) != 6:
         return None
-    hours = int(digits[0:2])
-    minutes = int(digits[2:4])
-    seconds = int(digits[4:6])
+    try:
+        hours = _DIGIT_PAIRS[digits[0:2]]
+        minutes = _DIGIT_PAIRS[digits[2:4]]
+        seconds = _DIGIT_PAIRS[digits[4:6]]
+    except KeyError:
+        return None
     if minutes > 59 or seconds > 59:
         return None
     return hours * 3600 + minutes * 60 + seconds
@@ -156,13 +192,16 @@ def _parse_countdown_digits(digits: str) -> Optional[int]:
 def _parse_deadline_digits(digits: str) -> Optional[datetime]:
     if len(digits) != 12:
         return None
-    year = int(digits[0:4])
-    month = int(digits[4:6])
-    day = int(digits[6:8])
-    hour = int(digits[8:10])
-    minute = int(digits[10:12])
     try:
-        return datetime(year, month, day, hour, minute, tzinfo=_local_tzinfo())
+        year = _DIGIT_PAIRS[digits[0:2]] * 100 + _DIGIT_PAIRS[digits[2:4]]
+        month = _DIGIT_PAIRS[digits[4:6]]
+        day = _DIGIT_PAIRS[digits[6:8]]
+        hour = _DIGIT_PAIRS[digits[8:10]]
+        minute = _DIGIT_PAIRS[digits[10:12]]
+    except KeyError:
+        return None
+    try:
+        return datetime(year, month, day, hour, minute, tzinfo=timecalc.local_tzinfo())
     except ValueError:
         return None
 
@@ -172,27 +211,57 @@ def _keydebug_enabled() -> bool:
 
 
 def _keydebug_log(raw_repr: str, raw_type: str, keyname: str, decoded: str, seq: str) -> str:
+    global _KEYDEBUG_FH
     line = f"{datetime.now().isoformat()} raw={raw_repr} type={raw_type} keyname={keyname} decoded={decoded} seq={seq}"
     if not _keydebug_enabled():
         return line
     path = get_config_path().parent / "keydebug.log"
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        lines = []
-        if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-        lines.append(line)
-        if len(lines) > 500:
-            lines = lines[-500:]
-        with path.open("w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        if _KEYDEBUG_FH is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _KEYDEBUG_FH = path.open("a", encoding="utf-8", buffering=1)
+        _KEYDEBUG_FH.write(line + "\n")
+        if _KEYDEBUG_FH.tell() > KEYDEBUG_MAX_BYTES:
+            _KEYDEBUG_FH.close()
+            _KEYDEBUG_FH = None
+            os.replace(path, path.with_suffix(".log.1"))
     except OSError:
-        pass
+        _KEYDEBUG_FH = None
     return line
 
 
+def _build_byte_keys() -> List[Optional[Tuple[str, Optional[str]]]]:
+    table: List[Optional[Tuple[str, Optional[str]]]] = [None] * 256
+    for code in range(256):
+        ch = chr(code)
+        if ch.isdigit():
+            table[code] = ("digit", ch)
+    table[10] = table[13] = ("enter", None)
+    table[8] = table[127] = ("backspace", None)
+    return table
+
+
+_BYTE_KEYS = _build_byte_keys()
+
+# Numeric keypad in application mode sends ESC O <code>.
+_KEYPAD_KEYS = {
+    "p": ("digit", "0"),
+    "q": ("digit", "1"),
+    "r": ("digit", "2"),
+    "s": ("digit", "3"),
+    "t": ("digit", "4"),
+    "u": ("digit", "5"),
+    "v": ("digit", "6"),
+    "w": ("digit", "7"),
+    "x": ("digit", "8"),
+    "y": ("digit", "9"),
+    "M": ("enter", None),
+}
+
+
 def _decode_modal_key(stdscr, key) -> Tuple[str, Optional[str], str]:
+    import curses
+
     seq = ""
     raw_repr = repr(key)
     raw_type = type(key).__name__
@@ -222,21 +291,16 @@ def _decode_modal_key(stdscr, key) -> Tuple[str, Optional[str], str]:
         elif key in ("\b", "\x7f"):
             decoded_kind = "backspace"
     elif isinstance(key, int):
-        if key in (curses.KEY_ENTER, 10, 13):
-            decoded_kind = "enter"
-        elif key in (curses.KEY_BACKSPACE, 127, 8):
-            decoded_kind = "backspace"
-        elif key == 27:
+        if key == 27:
             seq = "\x1b"
         elif 0 <= key <= 255:
-            ch = chr(key)
-            if ch.isdigit():
-                decoded_kind = "digit"
-                decoded_value = ch
-            elif ch in ("\n", "\r"):
-                decoded_kind = "enter"
-            elif ch == "\x1b":
-                seq = "\x1b"
+            entry = _BYTE_KEYS[key]
+            if entry is not None:
+                decoded_kind, decoded_value = entry
+        elif key == curses.KEY_ENTER:
+            decoded_kind = "enter"
+        elif key == curses.KEY_BACKSPACE:
+            decoded_kind = "backspace"
 
     if seq:
         extra = ""
@@ -256,26 +320,9 @@ def _decode_modal_key(stdscr, key) -> Tuple[str, Optional[str], str]:
         if seq == "\x1b":
             decoded_kind = "esc"
         elif seq.startswith("\x1bO") and len(seq) >= 3:
-            code = seq[2]
-            keypad_map = {
-                "p": "0",
-                "q": "1",
-                "r": "2",
-                "s": "3",
-                "t": "4",
-                "u": "5",
-                "v": "6",
-                "w": "7",
-                "x": "8",
-                "y": "9",
-                "M": "enter",
-            }
-            mapped = keypad_map.get(code)
-            if mapped == "enter":
-                decoded_kind = "enter"
-            elif mapped is not None:
-                decoded_kind = "digit"
-                decoded_value = mapped
+            entry = _KEYPAD_KEYS.get(seq[2])
+            if entry is not None:
+                decoded_kind, decoded_value = entry
         elif seq.startswith("\x1b["):
             decoded_kind = "ignore"
 
@@ -302,42 +349,43 @@ def _get_all_time_info(now: datetime, dob: date, deadline: DeadlineState) -> Dic
     return info
 
 
+def _format_ymd_hms(dt: datetime) -> str:
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
 def _format_header(info: Dict[str, timecalc.TimeInfo]) -> str:
-    now_str = info["day"].now.strftime("%Y-%m-%d %H:%M:%S")
+    now_str = _format_ymd_hms(info["day"].now)
     day_pct = info["day"].progress * 100
     year_pct = info["year"].progress * 100
     life_pct = info["life"].progress * 100
     return f"now: {now_str} | day {day_pct:5.1f}% | year {year_pct:5.1f}% | life {life_pct:5.1f}%"
 
 
-def _pane_menu_items(state: UIState) -> List[str]:
-    if state.pane_view == "menu":
-        return [
-            "Resume",
-            "Set/Manage Countdown Timer",
-            "Set/Manage Deadline Timer",
-            "Controls",
-            "Config path info",
-        ]
-    if state.pane_view == "controls":
-        return ["Back"]
-    if state.pane_view == "config":
-        return ["Back"]
-    if state.pane_view == "countdown":
-        return [
-            "Set duration (HH:MM:SS)",
-            "Start/Pause",
-            "Reset to original duration",
-            "Clear timer",
-            "Back",
-        ]
-    if state.pane_view == "deadline":
-        return [
-            "Set deadline (YYYY-MM-DD HH:MM)",
-            "Clear timer",
-            "Back",
-        ]
-    return ["Back"]
+_PANE_MENUS: Dict[str, Tuple[str, ...]] = {
+    "menu": (
+        "Resume",
+        "Set/Manage Countdown Timer",
+        "Set/Manage Deadline Timer",
+        "Controls",
+        "Config path info",
+    ),
+    "countdown": (
+        "Set duration (HH:MM:SS)",
+        "Start/Pause",
+        "Reset to original duration",
+        "Clear timer",
+        "Back",
+    ),
+    "deadline": (
+        "Set deadline (YYYY-MM-DD HH:MM)",
+        "Clear timer",
+        "Back",
+    ),
+}
+
+
+def _pane_menu_items(state: UIState) -> Tuple[str, ...]:
+    return _PANE_MENUS.get(state.pane_view, ("Back",))
 
 
 def _pane_body_lines(state: UIState, info: Dict[str, timecalc.TimeInfo]) -> List[str]:
@@ -377,8 +425,8 @@ def _pane_body_lines(state: UIState, info: Dict[str, timecalc.TimeInfo]) -> List
             return [
                 "Deadline Timer",
                 "Configured: yes",
-                f"Target: {deadline.target_time.strftime('%Y-%m-%d %H:%M:%S')}",
-                f"Set at: {deadline.set_time.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"Target: {_format_ymd_hms(deadline.target_time)}",
+                f"Set at: {_format_ymd_hms(deadline.set_time)}",
                 f"Remaining: {remaining}",
             ]
         return ["Deadline Timer", "Configured: no"]
@@ -388,6 +436,30 @@ def _pane_body_lines(state: UIState, info: Dict[str, timecalc.TimeInfo]) -> List
     ]
 
 
+@functools.lru_cache(maxsize=32)
+def _border_rows(width: int) -> Tuple[str, str]:
+    if width < 2:
+        return "+" * width, "|" * width
+    return "+" + "-" * (width - 2) + "+", "|" + " " * (width - 2) + "|"
+
+
+def _draw_box(stdscr, start_y: int, start_x: int, width: int, lines: List[str], centered: int = -1) -> None:
+    import curses
+
+    edge, middle = _border_rows(width)
+    box_rows = [edge]
+    for i, line in enumerate(lines):
+        line = line[: max(0, width - 4)]
+        pad = max(2, (width - len(line)) // 2) if i == centered else 2
+        box_rows.append(middle[:pad] + line + middle[pad + len(line) :])
+    box_rows.append(edge)
+    for y, row in enumerate(box_rows):
+        try:
+            stdscr.addstr(start_y + y, start_x, row)
+        except curses.error:
+            pass
+
+
 def _draw_input_modal(stdscr, rows: int, cols: int, state: UIState) -> None:
     if state.pane_view == "countdown_input":
         title = "ENTER DURATION (HH:MM:SS)"
@@ -398,40 +470,24 @@ def _draw_input_modal(stdscr, rows: int, cols: int, state: UIState) -> None:
 
     caret = ">" if state.flash_on else " "
     hint = "Digits only. Backspace delete. Enter confirm. Esc cancel."
-    lines = [title, "", f"{caret} {formatted}", "", hint]
+    entry = f"{caret} {formatted}"
+    lines = [title, "", entry, "", hint]
+    max_len = max(len(title), len(entry), len(hint))
     if state.input_error:
-        lines.extend(["", f"Error: {state.input_error}"])
+        error_line = f"Error: {state.input_error}"
+        lines += ("", error_line)
+        max_len = max(max_len, len(error_line))
     if _keydebug_enabled() and state.last_keydebug:
-        lines.extend(["", f"Key: {state.last_keydebug}"])
+        key_line = f"Key: {state.last_keydebug}"
+        lines += ("", key_line)
+        max_len = max(max_len, len(key_line))
 
-    width = min(cols - 2, max(len(line) for line in lines) + 4)
+    width = min(cols - 2, max_len + 4)
     height = len(lines) + 2
     start_y = max(0, (rows - height) // 2)
     start_x = max(0, (cols - width) // 2)
 
-    for y in range(height):
-        for x in range(width):
-            ch = " "
-            if y == 0 or y == height - 1:
-                ch = "-"
-            if x == 0 or x == width - 1:
-                ch = "|"
-            if (y == 0 or y == height - 1) and (x == 0 or x == width - 1):
-                ch = "+"
-            try:
-                stdscr.addch(start_y + y, start_x + x, ch)
-            except curses.error:
-                pass
-
-    for i, line in enumerate(lines):
-        line = line[: max(0, width - 4)]
-        line_x = start_x + 2
-        if i == 2:
-            line_x = start_x + max(2, (width - len(line)) // 2)
-        try:
-            stdscr.addstr(start_y + 1 + i, line_x, line)
-        except curses.error:
-            pass
+    _draw_box(stdscr, start_y, start_x, width, lines, centered=2)
 
 
 def _draw_pane(stdscr, rows: int, cols: int, state: UIState, info: Dict[str, timecalc.TimeInfo]) -> None:
@@ -444,54 +500,49 @@ def _draw_pane(stdscr, rows: int, cols: int, state: UIState, info: Dict[str, tim
     body_lines = _pane_body_lines(state, info)
 
     lines = []
-    lines.extend(body_lines)
+    max_len = 0
+    for line in body_lines:
+        lines.append(line)
+        max_len = max(max_len, len(line))
     if body_lines:
         lines.append("")
     for idx, item in enumerate(menu_items):
         prefix = ">" if idx == state.pane_index else " "
         lines.append(f"{prefix} {item}")
+        max_len = max(max_len, len(item) + 2)
     if state.pane_error:
+        error_line = f"Error: {state.pane_error}"
         lines.append("")
-        lines.append(f"Error: {state.pane_error}")
+        lines.append(error_line)
+        max_len = max(max_len, len(error_line))
 
-    width = min(cols - 2, max(len(line) for line in lines) + 4)
+    width = min(cols - 2, max_len + 4)
     height = len(lines) + 2
     start_y = max(0, (rows - height) // 2)
     start_x = max(0, (cols - width) // 2)
 
-    for y in range(height):
-        for x in range(width):
-            ch = " "
-            if y == 0 or y == height - 1:
-                ch = "-"
-            if x == 0 or x == width - 1:
-                ch = "|"
-            if (y == 0 or y == height - 1) and (x == 0 or x == width - 1):
-                ch = "+"
-            try:
-                stdscr.addch(start_y + y, start_x + x, ch)
-            except curses.error:
-                pass
+    _draw_box(stdscr, start_y, start_x, width, lines)
 
-    for i, line in enumerate(lines):
-        line = line[: max(0, width - 4)]
-        try:
-            stdscr.addstr(start_y + 1 + i, start_x + 2, line)
-        except curses.error:
-            pass
+
+def _put_text(canvas: bytearray, cols: int, row: int, x: int, text: str) -> None:
+    _put_bytes(canvas, cols, row, x, text.encode("ascii", "replace"))
+
+
+def _put_bytes(canvas: bytearray, cols: int, row: int, x: int, data: bytes) -> None:
+    if not (0 <= row < len(canvas) // cols) or x >= cols:
+        return
+    data = data[: cols - x]
+    base = row * cols + x
+    canvas[base : base + len(data)] = data
 
 
 def _numbers_only_view(
-    canvas,
+    canvas: bytearray,
     info: Dict[str, timecalc.TimeInfo],
     cols: int,
     countdown: CountdownState,
     deadline: DeadlineState,
 ) -> None:
-    header = _format_header(info)
-    for i, ch in enumerate(header[:cols]):
-        canvas[0][i] = ch
-
     lines = [
         f"DAY  done: {info['day'].progress * 100:5.1f}%  remaining: {info['day'].remaining_str}",
         f"YEAR done: {info['year'].progress * 100:5.1f}%  remaining: {info['year'].remaining_str}",
@@ -510,88 +561,78 @@ def _numbers_only_view(
         done_mark = " (DONE)" if done else ""
         lines.append(f"DEADLINE done: {deadline_info.progress * 100:5.1f}%  remaining: {remaining}{done_mark}")
     for idx, line in enumerate(lines):
-        row = 1 + idx
-        if row >= len(canvas):
-            break
-        for i, ch in enumerate(line[:cols]):
-            canvas[row][i] = ch
+        _put_text(canvas, cols, 1 + idx, 0, line)
 
 
-def _draw_column_label(canvas, x: int, width: int, label_lines: list, start_row: int) -> None:
-    for i, text in enumerate(label_lines):
-        row = start_row + i
-        if not (0 <= row < len(canvas)):
-            continue
-        text = text[:width]
-        start_x = x + max(0, (width - len(text)) // 2)
-        for j, ch in enumerate(text):
-            xx = start_x + j
-            if 0 <= xx < len(canvas[0]):
-                canvas[row][xx] = ch
+def _draw_column_label(canvas: bytearray, cols: int, x: int, width: int, label_lines: List[bytes], start_row: int) -> None:
+    for i, data in enumerate(label_lines):
+        data = data[:width]
+        _put_bytes(canvas, cols, start_row + i, x + max(0, (width - len(data)) // 2), data)
+
+
+@functools.lru_cache(maxsize=64)
+def _row_fill(width: int, ch: bytes) -> bytes:
+    return ch * width
 
 
-def _draw_column_border(canvas, x: int, y: int, width: int, height: int, flash: bool = False) -> None:
+def _draw_column_border(canvas: bytearray, cols: int, x: int, y: int, width: int, height: int, flash: bool = False) -> None:
+    rows = len(canvas) // cols
     top = y
     bottom = y + height - 1
     left = x
     right = x + width - 1
-    horiz = "=" if flash else "-"
-    vert = "!" if flash else "|"
-    corner = "*" if flash else "+"
-
-    for col in range(left + 1, right):
-        if 0 <= top < len(canvas):
-            canvas[top][col] = horiz
-        if 0 <= bottom < len(canvas):
-            canvas[bottom][col] = horiz
-    if 0 <= top < len(canvas):
-        canvas[top][left] = corner
-        canvas[top][right] = corner
-    if 0 <= bottom < len(canvas):
-        canvas[bottom][left] = corner
-        canvas[bottom][right] = corner
-
-    for row in range(top + 1, bottom):
-        if 0 <= row < len(canvas):
-            if 0 <= left < len(canvas[0]):
-                canvas[row][left] = vert
-            if 0 <= right < len(canvas[0]):
-                canvas[row][right] = vert
+    horiz, vert, corner = _FLASH_BORDER_GLYPHS if flash else _BORDER_GLYPHS
+
+    edge = _row_fill(right - left - 1, horiz)
+    for row in (top, bottom):
+        if 0 <= row < rows:
+            base = row * cols
+            canvas[base + left + 1 : base + right] = edge
+            canvas[base + left] = corner
+            canvas[base + right] = corner
+
+    first = max(0, top + 1)
+    stop = min(rows, bottom)
+    if stop <= first:
+        return
+    side_rows = _row_fill(stop - first, vert)
+    for side in (left, right):
+        if 0 <= side < cols:
+            canvas[first * cols + side : stop * cols : cols] = side_rows
+
+
+def _fill_top(inner_top: int, inner_bottom: int, progress: float) -> int:
+    inner_h = inner_bottom - inner_top + 1
+    fill_rows = min(inner_h, int(inner_h * progress))
+    return inner_bottom - max(0, fill_rows) + 1
 
 
 def _draw_fill(
-    canvas,
+    canvas: bytearray,
+    cols: int,
     inner_left: int,
     inner_right: int,
-    inner_top: int,
+    fill_top: int,
     inner_bottom: int,
-    progress: float,
     flash: bool = False,
-) -> int:
-    inner_h = inner_bottom - inner_top + 1
-    fill_rows = int(inner_h * progress)
-    if fill_rows <= 0:
-        return inner_bottom
-    if fill_rows > inner_h:
-        fill_rows = inner_h
-    fill_top = inner_bottom - fill_rows + 1
-    for row in range(inner_bottom, fill_top - 1, -1):
-        depth = row - fill_top + 1
-        if flash:
-            ch = "*"
-        elif depth <= 2:
-            ch = "."
-        elif depth <= 5:
-            ch = "+"
-        else:
-            ch = "#"
-        for col in range(inner_left, inner_right + 1):
-            if 0 <= row < len(canvas) and 0 <= col < len(canvas[0]):
-                canvas[row][col] = ch
-    return fill_top
+) -> None:
+    if fill_top > inner_bottom:
+        return
+    rows = len(canvas) // cols
+    left = max(0, inner_left)
+    right = min(cols - 1, inner_right)
+    width = right - left + 1
+    if width <= 0:
+        return
+    surface, deep = _FLASH_FILL_GLYPHS if flash else _FILL_GLYPHS
+    for row in range(max(0, fill_top), min(rows - 1, inner_bottom) + 1):
+        depth = row - fill_top
+        base = row * cols
+        canvas[base + left : base + right + 1] = _row_fill(width, surface[depth : depth + 1] or deep)
 
 
-def _layout_columns(cols: int, count: int) -> Optional[Dict[str, int]]:
+@functools.lru_cache(maxsize=16)
+def _layout_columns(cols: int, count: int) -> Optional[Layout]:
     min_col_width = MIN_INNER_WIDTH + 2
     min_total = min_col_width * count + COLUMN_GAP * (count - 1)
     if cols < min_total:
@@ -620,21 +661,91 @@ def _layout_columns(cols: int, count: int) -> Optional[Dict[str, int]]:
         positions.append((x, w))
         x += w + COLUMN_GAP
 
-    return {
-        "positions": positions,
-        "inner_widths": inner_widths,
-    }
+    return Layout(positions=tuple(positions), inner_widths=tuple(inner_widths))
+
+
+def _update_column_state(state: UIState, col_state: ColumnState, info: Dict[str, timecalc.TimeInfo]) -> None:
+    col_state.flash = False
+    if col_state.mode in ("day", "year", "life"):
+        col_info = info[col_state.mode]
+        col_state.progress = col_info.progress
+        col_state.remaining = col_info.remaining_str
+    elif col_state.mode == "countdown":
+        remaining = state.countdown.remaining_seconds
+        duration = max(1, state.countdown.duration_seconds)
+        done = remaining == 0
+        col_state.progress = 1.0 if done else (duration - remaining) / duration
+        col_state.remaining = "DONE" if done else timecalc.format_hms_seconds(remaining)
+        col_state.flash = state.countdown.done_flash and state.flash_on
+    elif col_state.mode == "deadline":
+        deadline_info = info.get("deadline")
+        if deadline_info is None:
+            deadline_info = _get_deadline_info(state.deadline, timecalc.now_local())
+        if deadline_info is not None:
+            done = deadline_info.progress >= 1.0
+            col_state.progress = 1.0 if done else deadline_info.progress
+            col_state.remaining = "DONE" if done else deadline_info.remaining_str
+            if done:
+                state.deadline.done_flash = True
+            else:
+                state.deadline.done_flash = False
+            col_state.flash = state.deadline.done_flash and state.flash_on
+        else:
+            col_state.progress = 0.0
+            col_state.remaining = "--"
+
+
+def _blit_canvas(stdscr, state: UIState, canvas: bytearray, rows: int, cols: int) -> bool:
+    import curses
+
+    full = state.force_full_redraw or state.pane_open or state.last_size != (rows, cols)
+    # The pane is drawn over the canvas, so the frame after it closes must repaint everything.
+    state.force_full_redraw = state.pane_open
+    if full:
+        state.last_size = (rows, cols)
+        state.last_rendered = [canvas[y * cols : (y + 1) * cols] for y in range(rows)]
+        # One wrapping write covers every cell; curses raises after filling the last one.
+        try:
+            stdscr.addstr(0, 0, canvas.decode("ascii"))
+        except curses.error:
+            pass
+        return True
+
+    changed = False
+    last_rendered = state.last_rendered
+    for y in range(rows):
+        row = canvas[y * cols : (y + 1) * cols]
+        if row == last_rendered[y]:
+            continue
+        last_rendered[y] = row
+        changed = True
+        try:
+            stdscr.addstr(y, 0, row.decode("ascii"))
+        except curses.error:
+            pass
+    return changed
 
 
 def _visible_columns(state: UIState) -> List[ColumnState]:
+    key = (state.countdown.configured, state.deadline.configured)
+    if key == state.visible_key:
+        return state.visible_columns
     columns = list(state.columns)
     if state.countdown.configured:
         columns.append(state.countdown_column)
     if state.deadline.configured:
         columns.append(state.deadline_column)
+    state.visible_key = key
+    state.visible_columns = columns
     return columns
 
 
+def _save_countdown(state: UIState, config: Dict) -> None:
+    countdown = state.countdown
+    set_countdown_timer(config, countdown.duration_seconds, countdown.remaining_seconds, countdown.is_running)
+    countdown.saved_remaining = countdown.remaining_seconds
+
+
 def _toggle_countdown_running(state: UIState, config: Dict) -> Optional[str]:
     if not state.countdown.configured:
         return "Countdown timer is not configured."
@@ -642,12 +753,7 @@ def _toggle_countdown_running(state: UIState, config: Dict) -> Optional[str]:
         return "Countdown is DONE. Reset to start again."
     state.countdown.is_running = not state.countdown.is_running
     state.last_countdown_tick = 0.0
-    set_countdown_timer(
-        config,
-        state.countdown.duration_seconds,
-        state.countdown.remaining_seconds,
-        state.countdown.is_running,
-    )
+    _save_countdown(state, config)
     return None
 
 
@@ -658,12 +764,7 @@ def _reset_countdown(state: UIState, config: Dict) -> Optional[str]:
     state.countdown.is_running = False
     state.countdown.done_flash = False
     state.last_countdown_tick = 0.0
-    set_countdown_timer(
-        config,
-        state.countdown.duration_seconds,
-        state.countdown.remaining_seconds,
-        state.countdown.is_running,
-    )
+    _save_countdown(state, config)
     return None
 
 
@@ -675,7 +776,7 @@ def _clear_countdown(state: UIState, config: Dict) -> None:
 
 
 def _set_deadline(state: UIState, config: Dict, target_time: datetime) -> None:
-    now = datetime.now().astimezone()
+    now = timecalc.now_local()
     state.deadline.target_time = target_time
     state.deadline.set_time = now
     state.deadline.configured = True
@@ -690,7 +791,173 @@ def _clear_deadline(state: UIState, config: Dict) -> None:
     clear_deadline_timer(config)
 
 
+def _idle_delay(state: UIState, now: float) -> float:
+    delay = IDLE_FRAME_DELAY
+    if not state.paused:
+        delay = min(delay, 1.0 - time.time() % 1.0)
+    if state.countdown.is_running:
+        delay = min(delay, state.last_countdown_tick + 1.0 - now)
+    if state.pane_open or state.countdown.done_flash or state.deadline.done_flash:
+        delay = min(delay, state.last_flash_toggle + 0.5 - now)
+    return max(FRAME_DELAY, delay)
+
+
+def _read_key(stdscr, state: UIState):
+    import curses
+
+    if state.pane_open and state.pane_view in ("countdown_input", "deadline_input"):
+        try:
+            return stdscr.get_wch()
+        except curses.error:
+            return None
+    ch = stdscr.getch()
+    return None if ch == -1 else ch
+
+
+def _handle_key(stdscr, state: UIState, config: Dict, ch) -> bool:
+    import curses
+
+    if (isinstance(ch, str) and ch.lower() == "q") or (
+        isinstance(ch, int) and 0 <= ch <= 255 and chr(ch).lower() == "q"
+    ):
+        return True
+    if state.pane_open:
+        if state.pane_view in ("countdown_input", "deadline_input"):
+            try:
+                kind, value, debug_line = _decode_modal_key(stdscr, ch)
+            except Exception:
+                kind, value, debug_line = "ignore", None, "decode_error"
+            state.last_keydebug = debug_line if _keydebug_enabled() else ""
+            max_len = 6 if state.pane_view == "countdown_input" else 12
+            if kind == "digit" and value:
+                digits = _digits_only(value)
+                if digits:
+                    room = max_len - len(state.input_digits)
+                    state.input_digits += digits[:room]
+            elif kind == "backspace":
+                state.input_digits = state.input_digits[:-1]
+            elif kind == "esc":
+                state.pane_view = state.input_prev_view
+                state.input_digits = ""
+                state.input_error = ""
+                state.last_keydebug = ""
+            elif kind == "enter":
+                if state.pane_view == "countdown_input":
+                    seconds = _parse_countdown_digits(state.input_digits)
+                    if seconds is None:
+                        state.input_error = "Enter 6 digits (HHMMSS)."
+                    elif seconds < 1:
+                        state.input_error = "Duration must be at least 1 second."
+                    else:
+                        state.countdown.duration_seconds = seconds
+                        state.countdown.remaining_seconds = seconds
+                        state.countdown.is_running = True
+                        state.countdown.configured = True
+                        state.countdown.done_flash = False
+                        state.last_countdown_tick = 0.0
+                        _save_countdown(state, config)
+                        state.pane_open = False
+                        state.pane_view = "menu"
+                        state.pane_index = 0
+                        state.input_digits = ""
+                        state.input_error = ""
+                        state.last_keydebug = ""
+                else:
+                    target = _parse_deadline_digits(state.input_digits)
+                    if target is None:
+                        state.input_error = "Enter 12 digits (YYYYMMDDHHMM)."
+                    else:
+                        _set_deadline(state, config, target)
+                        state.time_info = None
+                        state.pane_view = state.input_prev_view
+                        state.pane_index = 0
+                        state.input_digits = ""
+                        state.input_error = ""
+                        state.last_keydebug = ""
+            else:
+                pass
+        else:
+            menu_items = _pane_menu_items(state)
+            if ch in _HELP_KEYS:
+                state.pane_open = False
+                state.pane_error = ""
+            elif ch == curses.KEY_UP:
+                state.pane_index = (state.pane_index - 1) % len(menu_items)
+            elif ch == curses.KEY_DOWN:
+                state.pane_index = (state.pane_index + 1) % len(menu_items)
+            elif ch in (curses.KEY_ENTER, 10, 13):
+                selection = menu_items[state.pane_index]
+                state.pane_error = ""
+                if state.pane_view == "menu":
+                    if selection == "Resume":
+                        state.pane_open = False
+                    elif selection == "Set/Manage Countdown Timer":
+                        state.pane_view = "countdown"
+                        state.pane_index = 0
+                    elif selection == "Set/Manage Deadline Timer":
+                        state.pane_view = "deadline"
+                        state.pane_index = 0
+                    elif selection == "Controls":
+                        state.pane_view = "controls"
+                        state.pane_index = 0
+                    elif selection == "Config path info":
+                        state.pane_view = "config"
+                        state.pane_index = 0
+                elif state.pane_view in ("controls", "config"):
+                    if selection == "Back":
+                        state.pane_view = "menu"
+                        state.pane_index = 0
+                elif state.pane_view == "countdown":
+                    if selection.startswith("Set duration"):
+                        state.input_prev_view = "countdown"
+                        state.pane_view = "countdown_input"
+                        state.input_digits = ""
+                        state.input_error = ""
+                        state.last_keydebug = ""
+                    elif selection == "Start/Pause":
+                        error = _toggle_countdown_running(state, config)
+                        if error:
+                            state.pane_error = error
+                    elif selection == "Reset to original duration":
+                        error = _reset_countdown(state, config)
+                        if error:
+                            state.pane_error = error
+                    elif selection == "Clear timer":
+                        _clear_countdown(state, config)
+                    elif selection == "Back":
+                        state.pane_view = "menu"
+                        state.pane_index = 0
+                elif state.pane_view == "deadline":
+                    if selection.startswith("Set deadline"):
+                        state.input_prev_view = "deadline"
+                        state.pane_view = "deadline_input"
+                        state.input_digits = ""
+                        state.input_error = ""
+                        state.last_keydebug = ""
+                    elif selection == "Clear timer":
+                        _clear_deadline(state, config)
+                    elif selection == "Back":
+                        state.pane_view = "menu"
+                        state.pane_index = 0
+    else:
+        if ch == _PAUSE_KEY:
+            state.paused = not state.paused
+            if not state.paused:
+                state.time_info_second = -1
+        if ch in _HELP_KEYS:
+            state.pane_open = True
+            state.pane_view = "menu"
+            state.pane_index = 0
+            state.pane_error = ""
+            state.input_digits = ""
+            state.input_error = ""
+            state.last_keydebug = ""
+    return False
+
+
 def run(_mode: str, config: Dict) -> None:
+    import curses
+
     dob = _ensure_dob(config)
 
     stdscr = curses.initscr()
@@ -699,7 +966,6 @@ def run(_mode: str, config: Dict) -> None:
     curses.noecho()
     curses.cbreak()
     stdscr.keypad(True)
-    stdscr.nodelay(True)
     try:
         curses.curs_set(0)
     except curses.error:
@@ -714,173 +980,41 @@ def run(_mode: str, config: Dict) -> None:
         state.countdown.remaining_seconds = remaining
         state.countdown.is_running = False
         state.countdown.configured = True
+        state.countdown.saved_remaining = remaining
         if countdown_cfg["is_running"] or remaining != countdown_cfg["remaining_seconds"]:
             set_countdown_timer(config, duration, remaining, False)
 
     deadline_cfg = get_deadline_timer(config)
     if deadline_cfg:
-        target_time = _parse_iso_local(deadline_cfg["target_local_datetime_iso"])
-        set_time = _parse_iso_local(deadline_cfg["set_local_datetime_iso"])
+        target_time = timecalc.parse_iso_local(deadline_cfg["target_local_datetime_iso"])
+        set_time = timecalc.parse_iso_local(deadline_cfg["set_local_datetime_iso"])
         if target_time and set_time:
             state.deadline.target_time = target_time
             state.deadline.set_time = set_time
             state.deadline.configured = True
-    last_time = time.time()
-    frame_delay = 1.0 / 24.0
+    last_time = time.monotonic()
+    delay = 0.0
+    idle = False
 
     try:
         while True:
-            now = time.time()
+            # Wait for the next frame inside the first read so a keypress wakes the loop at once.
+            stdscr.timeout(int(delay * 1000))
+            ch = _read_key(stdscr, state)
+            stdscr.timeout(0)
+            quit_requested = False
+            while ch is not None:
+                if _handle_key(stdscr, state, config, ch):
+                    quit_requested = True
+                    break
+                ch = _read_key(stdscr, state)
+            if quit_requested:
+                break
+
+            now = time.monotonic()
             dt = now - last_time
             last_time = now
 
-            if state.pane_open and state.pane_view in ("countdown_input", "deadline_input"):
-                try:
-                    ch = stdscr.get_wch()
-                except curses.error:
-                    ch = None
-            else:
-                ch = stdscr.getch()
-                if ch == -1:
-                    ch = None
-
-            if ch is not None:
-                if (isinstance(ch, str) and ch.lower() == "q") or (
-                    isinstance(ch, int) and 0 <= ch <= 255 and chr(ch).lower() == "q"
-                ):
-                    break
-                if state.pane_open:
-                    if state.pane_view in ("countdown_input", "deadline_input"):
-                        try:
-                            kind, value, debug_line = _decode_modal_key(stdscr, ch)
-                        except Exception:
-                            kind, value, debug_line = "ignore", None, "decode_error"
-                        state.last_keydebug = debug_line if _keydebug_enabled() else ""
-                        max_len = 6 if state.pane_view == "countdown_input" else 12
-                        if kind == "digit" and value:
-                            digits = _digits_only(value)
-                            if digits:
-                                room = max_len - len(state.input_digits)
-                                state.input_digits += digits[:room]
-                        elif kind == "backspace":
-                            state.input_digits = state.input_digits[:-1]
-                        elif kind == "esc":
-                            state.pane_view = state.input_prev_view
-                            state.input_digits = ""
-                            state.input_error = ""
-                            state.last_keydebug = ""
-                        elif kind == "enter":
-                            if state.pane_view == "countdown_input":
-                                seconds = _parse_countdown_digits(state.input_digits)
-                                if seconds is None:
-                                    state.input_error = "Enter 6 digits (HHMMSS)."
-                                elif seconds < 1:
-                                    state.input_error = "Duration must be at least 1 second."
-                                else:
-                                    state.countdown.duration_seconds = seconds
-                                    state.countdown.remaining_seconds = seconds
-                                    state.countdown.is_running = True
-                                    state.countdown.configured = True
-                                    state.countdown.done_flash = False
-                                    state.last_countdown_tick = 0.0
-                                    set_countdown_timer(config, seconds, seconds, True)
-                                    state.pane_open = False
-                                    state.pane_view = "menu"
-                                    state.pane_index = 0
-                                    state.input_digits = ""
-                                    state.input_error = ""
-                                    state.last_keydebug = ""
-                            else:
-                                target = _parse_deadline_digits(state.input_digits)
-                                if target is None:
-                                    state.input_error = "Enter 12 digits (YYYYMMDDHHMM)."
-                                else:
-                                    _set_deadline(state, config, target)
-                                    state.time_info = None
-                                    state.pane_view = state.input_prev_view
-                                    state.pane_index = 0
-                                    state.input_digits = ""
-                                    state.input_error = ""
-                                    state.last_keydebug = ""
-                        else:
-                            pass
-                    else:
-                        menu_items = _pane_menu_items(state)
-                        if ch in (ord("h"), ord("H")):
-                            state.pane_open = False
-                            state.pane_error = ""
-                        elif ch == curses.KEY_UP:
-                            state.pane_index = (state.pane_index - 1) % len(menu_items)
-                        elif ch == curses.KEY_DOWN:
-                            state.pane_index = (state.pane_index + 1) % len(menu_items)
-                        elif ch in (curses.KEY_ENTER, 10, 13):
-                            selection = menu_items[state.pane_index]
-                            state.pane_error = ""
-                            if state.pane_view == "menu":
-                                if selection == "Resume":
-                                    state.pane_open = False
-                                elif selection == "Set/Manage Countdown Timer":
-                                    state.pane_view = "countdown"
-                                    state.pane_index = 0
-                                elif selection == "Set/Manage Deadline Timer":
-                                    state.pane_view = "deadline"
-                                    state.pane_index = 0
-                                elif selection == "Controls":
-                                    state.pane_view = "controls"
-                                    state.pane_index = 0
-                                elif selection == "Config path info":
-                                    state.pane_view = "config"
-                                    state.pane_index = 0
-                            elif state.pane_view in ("controls", "config"):
-                                if selection == "Back":
-                                    state.pane_view = "menu"
-                                    state.pane_index = 0
-                            elif state.pane_view == "countdown":
-                                if selection.startswith("Set duration"):
-                                    state.input_prev_view = "countdown"
-                                    state.pane_view = "countdown_input"
-                                    state.input_digits = ""
-                                    state.input_error = ""
-                                    state.last_keydebug = ""
-                                elif selection == "Start/Pause":
-                                    error = _toggle_countdown_running(state, config)
-                                    if error:
-                                        state.pane_error = error
-                                elif selection == "Reset to original duration":
-                                    error = _reset_countdown(state, config)
-                                    if error:
-                                        state.pane_error = error
-                                elif selection == "Clear timer":
-                                    _clear_countdown(state, config)
-                                elif selection == "Back":
-                                    state.pane_view = "menu"
-                                    state.pane_index = 0
-                            elif state.pane_view == "deadline":
-                                if selection.startswith("Set deadline"):
-                                    state.input_prev_view = "deadline"
-                                    state.pane_view = "deadline_input"
-                                    state.input_digits = ""
-                                    state.input_error = ""
-                                    state.last_keydebug = ""
-                                elif selection == "Clear timer":
-                                    _clear_deadline(state, config)
-                                elif selection == "Back":
-                                    state.pane_view = "menu"
-                                    state.pane_index = 0
-                else:
-                    if ch == ord(" "):
-                        state.paused = not state.paused
-                        if not state.paused:
-                            state.last_time_update = 0.0
-                    if ch in (ord("h"), ord("H")):
-                        state.pane_open = True
-                        state.pane_view = "menu"
-                        state.pane_index = 0
-                        state.pane_error = ""
-                        state.input_digits = ""
-                        state.input_error = ""
-                        state.last_keydebug = ""
-
             if now - state.last_flash_toggle >= 0.5:
                 state.flash_on = not state.flash_on
                 state.last_flash_toggle = now
@@ -897,124 +1031,111 @@ def run(_mode: str, config: Dict) -> None:
                         if remaining == 0:
                             state.countdown.is_running = False
                             state.countdown.done_flash = True
-                        set_countdown_timer(
-                            config,
-                            state.countdown.duration_seconds,
-                            state.countdown.remaining_seconds,
-                            state.countdown.is_running,
-                        )
+                        if remaining == 0 or state.countdown.saved_remaining - remaining >= COUNTDOWN_SAVE_STEP:
+                            _save_countdown(state, config)
             else:
                 state.last_countdown_tick = 0.0
                 if state.countdown.configured and state.countdown.remaining_seconds == 0:
                     state.countdown.done_flash = True
 
             rows, cols = stdscr.getmaxyx()
-            canvas = [[" " for _ in range(cols)] for _ in range(rows)]
-
-            if state.paused:
-                if state.time_info is None:
-                    state.time_info = _get_all_time_info(datetime.now().astimezone(), dob, state.deadline)
-            else:
-                if now - state.last_time_update >= 1.0 or state.time_info is None:
-                    state.time_info = _get_all_time_info(datetime.now().astimezone(), dob, state.deadline)
-                    state.last_time_update = now
 
+            wall_second = int(time.time())
+            if state.time_info is None or (not state.paused and wall_second != state.time_info_second):
+                state.time_info = _get_all_time_info(timecalc.now_local(), dob, state.deadline)
+                state.time_info_second = wall_second
             info = state.time_info
-            if info is None:
-                info = _get_all_time_info(datetime.now().astimezone(), dob, state.deadline)
 
             visible_columns = _visible_columns(state)
             min_rows = HEADER_LINES + LABEL_LINES + MIN_COLUMN_HEIGHT + BOTTOM_PADDING
             layout = _layout_columns(cols, len(visible_columns))
-            if rows < min_rows or layout is None:
-                _numbers_only_view(canvas, info, cols, state.countdown, state.deadline)
+            numbers_only = rows < min_rows or layout is None
+            col_height = rows - HEADER_LINES - LABEL_LINES - BOTTOM_PADDING
+            top_border = HEADER_LINES + LABEL_LINES
+            inner_top = top_border + 1
+            inner_bottom = top_border + col_height - 2
+            if numbers_only:
                 for col_state in visible_columns:
                     col_state.sand.reset()
             else:
-                header = _format_header(info)
-                for i, ch in enumerate(header[:cols]):
-                    canvas[0][i] = ch
-
-                col_height = rows - HEADER_LINES - LABEL_LINES - BOTTOM_PADDING
-                top_border = HEADER_LINES + LABEL_LINES
-
+                # After an idle frame dt spans up to IDLE_FRAME_DELAY; resume the sand with one frame's step.
+                sand_dt = FRAME_DELAY if idle else dt
                 for idx, col_state in enumerate(visible_columns):
-                    flash = False
-                    if col_state.mode in ("day", "year", "life"):
-                        col_info = info[col_state.mode]
-                        col_state.progress = col_info.progress
-                        col_state.remaining = col_info.remaining_str
-                    elif col_state.mode == "countdown":
-                        remaining = state.countdown.remaining_seconds
-                        duration = max(1, state.countdown.duration_seconds)
-                        done = remaining == 0
-                        col_state.progress = 1.0 if done else (duration - remaining) / duration
-                        col_state.remaining = "DONE" if done else timecalc.format_hms_seconds(remaining)
-                        flash = state.countdown.done_flash and state.flash_on
-                    elif col_state.mode == "deadline":
-                        deadline_info = info.get("deadline")
-                        if deadline_info is None:
-                            deadline_info = _get_deadline_info(state.deadline, datetime.now().astimezone())
-                        if deadline_info is not None:
-                            done = deadline_info.progress >= 1.0
-                            col_state.progress = 1.0 if done else deadline_info.progress
-                            col_state.remaining = "DONE" if done else deadline_info.remaining_str
-                            if done:
-                                state.deadline.done_flash = True
-                            else:
-                                state.deadline.done_flash = False
-                            flash = state.deadline.done_flash and state.flash_on
-                        else:
-                            col_state.progress = 0.0
-                            col_state.remaining = "--"
-
-                    col_x, col_width = layout["positions"][idx]
-                    inner_width = layout["inner_widths"][idx]
-                    label_lines = [
-                        col_state.label,
-                        f"done: {col_state.progress * 100:5.1f}%",
-                        f"remaining: {col_state.remaining}",
-                    ]
-                    _draw_column_label(canvas, col_x, col_width, label_lines, HEADER_LINES)
-                    _draw_column_border(canvas, col_x, top_border, col_width, col_height, flash=flash)
-
+                    _update_column_state(state, col_state, info)
+                    col_state.fill_top = _fill_top(inner_top, inner_bottom, col_state.progress)
+                    if state.paused:
+                        continue
+                    col_x, _col_width = layout.positions[idx]
                     inner_left = col_x + 1
-                    inner_right = inner_left + inner_width - 1
-                    inner_top = top_border + 1
-                    inner_bottom = top_border + col_height - 2
-
-                    surface_row = _draw_fill(
-                        canvas,
-                        inner_left,
-                        inner_right,
-                        inner_top,
-                        inner_bottom,
-                        col_state.progress,
-                        flash=flash,
-                    )
-
+                    inner_right = inner_left + layout.inner_widths[idx] - 1
                     col_state.sand.update(
-                        dt,
+                        sand_dt,
                         inner_left,
                         inner_right,
                         inner_top,
-                        surface_row,
-                        state.paused,
+                        min(inner_bottom, col_state.fill_top),
                     )
-                    col_state.sand.render(canvas, grain_ch=".", sparkle_ch="*")
 
-            stdscr.erase()
-            for y in range(rows):
-                try:
-                    stdscr.addstr(y, 0, "".join(canvas[y]))
-                except curses.error:
-                    pass
+            frame_sig = (
+                rows,
+                cols,
+                info["day"].now,
+                state.flash_on,
+                state.countdown.configured,
+                state.countdown.remaining_seconds,
+                state.countdown.is_running,
+                state.deadline.configured,
+                tuple((c.progress, c.remaining, c.flash, c.sand.version) for c in visible_columns),
+                state.pane_open,
+            )
+            if state.pane_open or frame_sig != state.last_frame_sig:
+                state.last_frame_sig = frame_sig
+                canvas = state.canvas
+                if len(canvas) != rows * cols:
+                    state.blank_canvas = b" " * (rows * cols)
+                    canvas = state.canvas = bytearray(state.blank_canvas)
+                else:
+                    canvas[:] = state.blank_canvas
+                if state.header_info is not info:
+                    state.header_info = info
+                    state.header = _format_header(info).encode("ascii", "replace")
+                _put_bytes(canvas, cols, 0, 0, state.header)
+                if numbers_only:
+                    _numbers_only_view(canvas, info, cols, state.countdown, state.deadline)
+                else:
+                    for idx, col_state in enumerate(visible_columns):
+                        col_x, col_width = layout.positions[idx]
+                        inner_left = col_x + 1
+                        inner_right = inner_left + layout.inner_widths[idx] - 1
+                        if col_state.label_progress != col_state.progress:
+                            col_state.label_progress = col_state.progress
+                            col_state.label_lines[1] = b"done: %5.1f%%" % (col_state.progress * 100)
+                        if col_state.label_remaining != col_state.remaining:
+                            col_state.label_remaining = col_state.remaining
+                            col_state.label_lines[2] = b"remaining: " + col_state.remaining.encode("ascii", "replace")
+                        _draw_column_label(canvas, cols, col_x, col_width, col_state.label_lines, HEADER_LINES)
+                        _draw_column_border(canvas, cols, col_x, top_border, col_width, col_height, flash=col_state.flash)
+                        _draw_fill(
+                            canvas,
+                            cols,
+                            inner_left,
+                            inner_right,
+                            col_state.fill_top,
+                            inner_bottom,
+                            flash=col_state.flash,
+                        )
+                        col_state.sand.render(canvas, cols, grain_ch=".", sparkle_ch="*")
 
-            if state.pane_open:
-                _draw_pane(stdscr, rows, cols, state, info)
+                changed = _blit_canvas(stdscr, state, canvas, rows, cols)
+
+                if state.pane_open:
+                    _draw_pane(stdscr, rows, cols, state, info)
 
-            stdscr.refresh()
-            time.sleep(frame_delay)
+                if changed:
+                    stdscr.refresh()
+            flush_config_if_due()
+            idle = state.paused or numbers_only
+            delay = _idle_delay(state, now) if idle else FRAME_DELAY
     finally:
         curses.nocbreak()
         stdscr.keypad(False)
@@ -1022,3 +1143,6 @@ def run(_mode: str, config: Dict) -> None:
         curses.endwin()
         sys.stdout.write("\x1b[?1049l")
         sys.stdout.flush()
+        if state.countdown.configured and state.countdown.remaining_seconds != state.countdown.saved_remaining:
+            _save_countdown(state, config)
+        flush_config()